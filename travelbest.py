@@ -1,9 +1,16 @@
 import streamlit as st
-from groq import Groq
-import folium
-from streamlit_folium import folium_static
-import tempfile
-import json
+import streamlit.components.v1 as components
+import diskcache
+from xml.sax.saxutils import escape
+import io
+from pathlib import Path
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import threading
+import time
+import re
+import orjson
 
 # --- Set Page Config ---
 st.set_page_config(
@@ -12,80 +19,317 @@ st.set_page_config(
     layout="centered"
 )
 
-# --- Initialize Groq Client ---
+# --- Groq Client ---
+# Heavy third-party packages (groq, folium, reportlab) are imported inside the
+# functions that need them so the first page paint doesn't wait on them
+
+# Cached so reruns reuse one client (and its HTTP connection pool) instead of
+# building a new one on every widget interaction
+@st.cache_resource
+def get_groq_client(api_key):
+    from groq import Groq
+    return Groq(api_key=api_key)
+
 try:
     groq_api_key = st.secrets.get("GROQ_API_KEY")
     if not groq_api_key:
         st.error("❌ GROQ_API_KEY not found in Streamlit secrets. Please configure it in your app settings.")
         st.stop()
-    
-    # Initialize client with just the API key
-    client = Groq(api_key=groq_api_key)
-    
 except Exception as e:
-    st.error(f"⚠️ Failed to initialize Groq client: {str(e)}")
+    st.error(f"⚠️ Failed to read Groq settings: {str(e)}")
     st.stop()
 
+# --- Static Assets ---
+ASSETS_DIR = Path(__file__).parent / "assets"
+
+@st.cache_resource
+def load_asset(name):
+    return (ASSETS_DIR / name).read_text(encoding="utf-8")
+
 # --- Custom CSS ---
-st.markdown("""
-<style>
-.small-font { font-size:14px !important; }
-.travel-card {
-    border-radius: 15px;
-    padding: 20px;
-    margin: 15px 0;
-    background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
-    box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-}
-.warning-card {
-    border-left: 5px solid #ff5252;
-    background-color: #fff5f5;
-    padding: 15px;
-    border-radius: 8px;
-}
-</style>
-""", unsafe_allow_html=True)
+# Streamlit rebuilds the page on every rerun, so the style block still has to be
+# emitted each time; only reading it from disk is done once
+st.markdown(f"<style>{load_asset('style.css')}</style>", unsafe_allow_html=True)
+
+# --- Input Options ---
+TRAVELER_TYPES = ("Solo", "Couple", "Family", "Business", "Friends Group")
+BUDGETS = ("💰 Budget", "💵 Comfort", "💎 Luxury")
+AGE_GROUPS = ("18-25", "26-40", "41-60", "60+", "Any")
+CLIMATES = ("Warm", "Cold", "Tropical", "Dry", "Any")
+CONTINENTS = ("Any", "Europe", "Asia", "Africa", "Americas", "Oceania")
+SEASONS = ("Summer", "Winter", "Spring", "Fall", "Any")
+LANDSCAPES = (
+    "Mountains", "Beaches", "Deserts", "Forests", "Islands",
+    "Lakes & Rivers", "Volcanoes", "Tundra", "Countryside",
+    "Canyons", "Cliffs", "Sand Dunes", "Waterfalls"
+)
+INTERESTS = (
+    "History", "Food & Street Eats", "Nature Trails", "Art & Museums",
+    "Shopping", "Nightlife & Clubs", "Photography", "Adventure Sports",
+    "Local Culture", "Relaxation", "Festivals & Events", "Spiritual Retreats",
+    "Tech & Innovation", "Sustainable Travel", "Music & Concerts", "Gaming & Esports",
+    "Wellness", "Hiking, trekking, and camping", "Social Media Hotspots", "Extreme Sports",
+    "Road Trips", "Digital Detox", "Scuba Diving & Underwater Adventures"
+)
+
+# --- Input Validation ---
+# (season, climate) pairs that narrow the choice to a few far-off regions;
+# worth pointing out, but still valid trips
+UNUSUAL_SEASON_CLIMATES = frozenset({
+    ("Summer", "Cold"),
+})
+
+def validate(user_inputs):
+    errors = []
+    if not user_inputs["interests"]:
+        errors.append("Pick at least one interest so we know what you enjoy.")
+    return errors
+
+def input_notes(user_inputs):
+    notes = []
+    if (user_inputs["season"], user_inputs["climate_preference"]) in UNUSUAL_SEASON_CLIMATES:
+        notes.append(
+            f"A {user_inputs['climate_preference'].lower()} climate in "
+            f"{user_inputs['season'].lower()} limits matches to high-latitude or high-altitude places."
+        )
+    return notes
+
+# --- Response Cache ---
+CACHE_DIR = ".llm_cache"
+CACHE_TTL = 86400  # seconds
+
+@st.cache_resource
+def get_response_cache():
+    return diskcache.Cache(CACHE_DIR)
+
+def canonical_inputs(user_inputs):
+    # Interest order doesn't change the recommendation, so equal sets share a key
+    return {**user_inputs, "interests": sorted(user_inputs["interests"])}
+
+def cache_key(user_inputs):
+    # The system prompt is part of the key so changing it never serves stale answers
+    payload = orjson.dumps(user_inputs, option=orjson.OPT_SORT_KEYS) + SYSTEM_PROMPT.encode()
+    return hashlib.sha256(payload).hexdigest()
+
+# --- Similar Profile Cache ---
+SIMILARITY_THRESHOLD = 0.6  # minimum Jaccard overlap of interests
+SIMILAR_PROFILES_MAX = 500
+
+def similar_profiles_prefix():
+    # Tied to the system prompt so a prompt change starts a fresh store
+    return "similar_profiles:" + hashlib.sha256(SYSTEM_PROMPT.encode()).hexdigest() + ":"
+
+# Shared by every session thread; all reads and writes go through "lock".
+# Each (stored_at, inputs, recs) entry is also kept in the response cache under
+# its own key with the same TTL as exact answers, so it survives restarts but
+# never outlives the answer it was copied from.
+@st.cache_resource
+def get_similar_profiles():
+    cache = get_response_cache()
+    prefix = similar_profiles_prefix()
+    entries = [
+        cache.get(key) for key in cache.iterkeys()
+        if isinstance(key, str) and key.startswith(prefix)
+    ]
+    entries = sorted((entry for entry in entries if entry is not None), key=lambda entry: entry[0])
+    return {
+        "entries": deque(entries, maxlen=SIMILAR_PROFILES_MAX),
+        "hits": 0,
+        "lock": threading.Lock(),
+    }
+
+def remember_profile(user_inputs, recs):
+    store = get_similar_profiles()
+    with store["lock"]:
+        entry = (time.time(), user_inputs, recs)
+        store["entries"].append(entry)
+    get_response_cache().set(similar_profiles_prefix() + cache_key(user_inputs), entry, expire=CACHE_TTL)
+
+def profile_similarity(a, b):
+    # Every field other than interests must match exactly; interests are compared as sets
+    if any(a[field] != b[field] for field in a if field != "interests"):
+        return 0.0
+    interests_a, interests_b = set(a["interests"]), set(b["interests"])
+    return len(interests_a & interests_b) / len(interests_a | interests_b)
+
+def find_similar_recommendation(user_inputs):
+    store = get_similar_profiles()
+    cutoff = time.time() - CACHE_TTL
+    with store["lock"]:
+        # Entries are appended in time order, so expired ones sit at the front
+        while store["entries"] and store["entries"][0][0] < cutoff:
+            store["entries"].popleft()
+        entries = list(store["entries"])
+
+    best_score, best_recs = 0.0, None
+    for _, inputs, recs in entries:
+        score = profile_similarity(user_inputs, inputs)
+        if score > best_score:
+            best_score, best_recs = score, recs
+    if best_score >= SIMILARITY_THRESHOLD:
+        with store["lock"]:
+            store["hits"] += 1
+        return best_recs
+    return None
+
+# --- Prompt ---
+# Kept byte-for-byte stable and sent first so Groq's prefix cache can reuse it
+# across requests; only the traveler profile goes into the user message.
+SYSTEM_PROMPT = """You are an elite travel curator with 20+ years of experience. Be extremely selective.
+Suggest the 3 best matching destinations for the traveler profile given by the user, best match first.
+Provide the best matches, even if only partial matches are found. Return ONLY this JSON structure:
+{
+    "destinations": [
+        {
+            "destination": "City, Country",
+            "match_score": "X/10 match score",
+            "why_perfect": ["3 bullet points max"],
+            "coordinates": [lat, lng],
+            "itinerary_highlights": ["Day 1: Morning/Afternoon/Evening", "Day 2:..."],
+            "local_secret": "One special insider tip",
+            "warning": "Main safety concern to note"
+        }
+    ]
+}"""
+
+# Pulls finished destination names out of the partially streamed JSON
+STREAMED_DESTINATION = re.compile(r'"destination"\s*:\s*"([^"]+)"')
+
+# Outermost {...} span, for responses that wrap the JSON in prose
+JSON_OBJECT = re.compile(r"\{.*\}", re.S)
+
+TEXT_FIELDS = ("destination", "match_score", "local_secret", "warning")
+LIST_FIELDS = ("why_perfect", "itinerary_highlights")
+REQUIRED_FIELDS = frozenset(TEXT_FIELDS + LIST_FIELDS + ("coordinates",))
+
+def is_valid_recommendation(rec):
+    if not isinstance(rec, dict) or not REQUIRED_FIELDS <= rec.keys():
+        return False
+    coordinates = rec["coordinates"]
+    if not (isinstance(coordinates, list) and len(coordinates) == 2):
+        return False
+    # bool is an int subclass, but true/false are never valid coordinates
+    if not all(isinstance(c, (int, float)) and not isinstance(c, bool) for c in coordinates):
+        return False
+    if not all(isinstance(rec[field], str) for field in TEXT_FIELDS):
+        return False
+    return all(
+        isinstance(rec[field], list) and all(isinstance(item, str) for item in rec[field])
+        for field in LIST_FIELDS
+    )
+
+def parse_recommendations(content):
+    try:
+        payload = orjson.loads(content)
+    except orjson.JSONDecodeError:
+        match = JSON_OBJECT.search(content)
+        if match is None:
+            raise
+        payload = orjson.loads(match.group())
+
+    recs = payload.get("destinations") if isinstance(payload, dict) else None
+    if not isinstance(recs, list) or not recs or not all(is_valid_recommendation(rec) for rec in recs):
+        raise ValueError("The model returned recommendations in an unexpected format.")
+    return recs
+
+def usage_field(obj, name):
+    # The pinned groq SDK doesn't model the x_groq extension, so its usage
+    # block arrives as a plain dict rather than an object
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+def read_usage(usage):
+    if usage is None:
+        return None
+    # Newer API versions report cached prefix tokens under prompt_tokens_details
+    details = usage_field(usage, "prompt_tokens_details")
+    cached_tokens = usage_field(details, "cached_tokens")
+    if cached_tokens is None:
+        cached_tokens = usage_field(usage, "cached_tokens")
+    return {
+        "prompt_tokens": usage_field(usage, "prompt_tokens") or 0,
+        "cached_tokens": cached_tokens or 0,
+    }
+
+def stream_completion(messages):
+    client = get_groq_client(groq_api_key)
+    stream = client.chat.completions.create(
+        model="llama3-70b-8192",
+        messages=messages,
+        temperature=0,
+        stream=True
+    )
+    progress = st.empty()
+    buffer, shown, usage = "", 0, None
+    for chunk in stream:
+        if chunk.choices:
+            buffer += chunk.choices[0].delta.content or ""
+            found = STREAMED_DESTINATION.findall(buffer)
+            if len(found) > shown:
+                shown = len(found)
+                progress.markdown("\n".join(f"- 📍 {name}" for name in found))
+        # Groq sends token usage with the final chunk
+        chunk_usage = usage_field(usage_field(chunk, "x_groq"), "usage")
+        if chunk_usage is not None:
+            usage = chunk_usage
+    progress.empty()
+    return buffer, usage
 
 # --- Recommendation Function ---
 def get_perfect_destination(user_inputs):
-    prompt = f"""
-    You are an elite travel curator with 20+ years of experience. Suggest the best matching destination based on the following profile:
-    - Traveler: {user_inputs['traveler_type']}
-    - Duration: {user_inputs['duration']} days
-    - Continent: {user_inputs['continent']}
-    - Interests: {', '.join(user_inputs['interests'])}
-    - Destination Type: {user_inputs['destination_type']}
-    - Budget: {user_inputs['budget']}
-    - Season: {user_inputs['season']}
-    - Age Group: {user_inputs['age_group']}
-    - Preferred Climate: {user_inputs['climate_preference']}
-
-    Provide the best match, even if partial matches are found. Return ONLY this JSON structure:
-    {{
-        "destination": "City, Country",
-        "match_score": "X/10 match score",
-        "why_perfect": ["3 bullet points max"],
-        "coordinates": [lat, lng],
-        "itinerary_highlights": ["Day 1: Morning/Afternoon/Evening", "Day 2:..."],
-        "local_secret": "One special insider tip",
-        "warning": "Main safety concern to note"
-    }}
-    """
+    errors = validate(user_inputs)
+    if errors:
+        for error in errors:
+            st.warning(f"⚠️ {error}")
+        return None
+    for note in input_notes(user_inputs):
+        st.info(f"ℹ️ {note}")
+
+    user_inputs = canonical_inputs(user_inputs)
+    key = cache_key(user_inputs)
+    cache = get_response_cache()
+    st.session_state.llm_usage = None
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    similar = find_similar_recommendation(user_inputs)
+    if similar is not None:
+        return similar
+
+    # Age group and climate are optional refinements; "Any" leaves them out
+    optional_lines = [
+        f"- {label}: {user_inputs[field]}"
+        for label, field in (("Age Group", "age_group"), ("Preferred Climate", "climate_preference"))
+        if user_inputs[field] != "Any"
+    ]
+    prompt = "\n".join([
+        "Traveler profile:",
+        f"- Traveler: {user_inputs['traveler_type']}",
+        f"- Duration: {user_inputs['duration']} days",
+        f"- Continent: {user_inputs['continent']}",
+        f"- Interests: {', '.join(user_inputs['interests'])}",
+        f"- Destination Type: {user_inputs['destination_type']}",
+        f"- Budget: {user_inputs['budget']}",
+        f"- Season: {user_inputs['season']}",
+        *optional_lines,
+    ])
     try:
-        response = client.chat.completions.create(
-            model="llama3-70b-8192",
-            messages=[
-                {"role": "system", "content": "You are an elite travel curator. Be extremely selective."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.5,
-            response_format={"type": "json_object"}
-        )
-        return json.loads(response.choices[0].message.content)
+        content, usage = stream_completion([
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ])
+        recs = parse_recommendations(content)
+        st.session_state.llm_usage = read_usage(usage)
     except Exception as e:
         st.error(f"⚠️ Error generating destination: {str(e)}")
         st.stop()
 
+    cache.set(key, recs, expire=CACHE_TTL)
+    remember_profile(user_inputs, recs)
+    return recs
+
 # --- Traveler Profile Section ---
 def traveler_profile_section():
     with st.container(border=True):
@@ -95,7 +339,7 @@ def traveler_profile_section():
         with cols[0]:
             traveler_type = st.radio(
                 "Who's traveling?",
-                ["Solo", "Couple", "Family", "Business", "Friends Group"],
+                TRAVELER_TYPES,
                 index=0
             )
 
@@ -108,15 +352,15 @@ def traveler_profile_section():
         with cols[2]:
             budget = st.select_slider(
                 "Budget level",
-                ["💰 Budget", "💵 Comfort", "💎 Luxury"],
+                BUDGETS,
                 value="💵 Comfort"
             )
 
         extra_cols = st.columns([1, 1])
         with extra_cols[0]:
-            age_group = st.selectbox("Age group", ["18-25", "26-40", "41-60", "60+"])
+            age_group = st.selectbox("Age group", AGE_GROUPS, index=AGE_GROUPS.index("Any"))
         with extra_cols[1]:
-            climate_preference = st.selectbox("Preferred Climate", ["Warm", "Cold", "Tropical", "Dry", "Any"])
+            climate_preference = st.selectbox("Preferred Climate", CLIMATES, index=CLIMATES.index("Any"))
 
     return {
         "traveler_type": traveler_type,
@@ -135,32 +379,21 @@ def destination_preferences_section():
         with cols[0]:
             continent = st.selectbox(
                 "Preferred continent",
-                ["Any", "Europe", "Asia", "Africa", "Americas", "Oceania"]
+                CONTINENTS
             )
             season = st.selectbox(
                 "Travel season",
-                ["Summer", "Winter", "Spring", "Fall", "Any"]
+                SEASONS
             )
 
         with cols[1]:
             destination_type = st.selectbox(
                 "Landscape type",
-                [
-                    "Mountains", "Beaches", "Deserts", "Forests", "Islands",
-                    "Lakes & Rivers", "Volcanoes", "Tundra", "Countryside",
-                    "Canyons", "Cliffs", "Sand Dunes", "Waterfalls"
-                ]
+                LANDSCAPES
             )
             interests = st.multiselect(
                 "Your interests",
-                [
-                    "History", "Food & Street Eats", "Nature Trails", "Art & Museums",
-                    "Shopping", "Nightlife & Clubs", "Photography", "Adventure Sports",
-                    "Local Culture", "Relaxation", "Festivals & Events", "Spiritual Retreats",
-                    "Tech & Innovation", "Sustainable Travel", "Music & Concerts", "Gaming & Esports",
-                    "Wellness","Hiking, trekking, and camping","Social Media Hotspots", "Extreme Sports", "Road Trips", "Digital Detox",
-                    "Extreme Sports","Scuba Diving & Underwater Adventures","Tech & Innovation"
-                ],
+                INTERESTS,
                 default=["Food & Street Eats", "Local Culture"]
             )
 
@@ -171,11 +404,101 @@ def destination_preferences_section():
         "interests": interests
     }
 
-# --- Save to JSON File ---
-def save_recommendation_to_file(rec):
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".json", mode="w") as tmp:
-        json.dump(rec, tmp, indent=4)
-        return tmp.name
+# --- Export as JSON ---
+@st.cache_data(show_spinner=False)
+def recommendation_to_json(rec):
+    return orjson.dumps(rec, option=orjson.OPT_INDENT_2)
+
+# --- Export as PDF ---
+@st.cache_resource
+def get_pdf_styles():
+    from reportlab.lib.styles import getSampleStyleSheet
+    return getSampleStyleSheet()
+
+@st.cache_data(show_spinner=False)
+def create_pdf(recommendation):
+    from reportlab.lib.pagesizes import A4
+    from reportlab.platypus import ListFlowable, Paragraph, SimpleDocTemplate
+
+    styles = get_pdf_styles()
+
+    def bullets(items):
+        return ListFlowable(
+            [Paragraph(escape(item.strip()), styles["Normal"]) for item in items],
+            bulletType="bullet"
+        )
+
+    story = [
+        Paragraph(escape(recommendation["destination"]), styles["Title"]),
+        Paragraph(f"<b>{escape(recommendation['match_score'])} match</b>", styles["Normal"]),
+        Paragraph("Why This Fits You", styles["Heading2"]),
+        bullets(recommendation["why_perfect"]),
+        Paragraph("Sample Itinerary", styles["Heading2"]),
+        bullets(recommendation["itinerary_highlights"]),
+        Paragraph("Local Insider Secret", styles["Heading2"]),
+        Paragraph(f"<i>{escape(recommendation['local_secret'])}</i>", styles["Normal"]),
+        Paragraph("Heads Up", styles["Heading2"]),
+        Paragraph(escape(recommendation["warning"]), styles["Normal"]),
+    ]
+
+    buf = io.BytesIO()
+    SimpleDocTemplate(buf, pagesize=A4).build(story)
+    return buf.getvalue()
+
+# --- Download Formats ---
+# label -> (exporter, file extension, MIME type)
+DOWNLOAD_FORMATS = {
+    "PDF": (create_pdf, "pdf", "application/pdf"),
+    "JSON": (recommendation_to_json, "json", "application/json"),
+}
+
+# --- Background Work ---
+@st.cache_resource
+def get_executor():
+    return ThreadPoolExecutor(max_workers=3)
+
+# --- Map ---
+@st.cache_data(show_spinner=False)
+def build_map_html(coordinates, destination):
+    import folium
+
+    m = folium.Map(location=coordinates, zoom_start=12)
+    folium.Marker(
+        coordinates,
+        tooltip=f"Explore {destination}",
+        icon=folium.Icon(color="red", icon="heart")
+    ).add_to(m)
+    return m.get_root().render()
+
+# --- Recommendation Card ---
+def render_recommendation(rec, user_inputs, index, download_format, download_future):
+    title = "🏆 Your Perfect Match" if index == 1 else f"Alternative #{index - 1}"
+    st.success(f"## {title}: {rec['destination']}")
+    st.markdown(f"**{rec['match_score']} match** | {user_inputs['duration']} day trip")
+
+    components.html(build_map_html(tuple(rec["coordinates"]), rec["destination"]), height=300)
+
+    st.markdown("### ❤️ Why This Fits You")
+    st.markdown("\n".join(f"- {point.strip()}" for point in rec["why_perfect"]))
+
+    st.markdown("### 📅 Sample Itinerary")
+    st.markdown("\n".join(f"- {day}" for day in rec["itinerary_highlights"]))
+
+    # Expanders can't be nested, and each recommendation already sits in one
+    st.markdown("### 🔍 Local Insider Secret")
+    st.info(f"*{rec['local_secret']}*")
+
+    st.markdown("### ⚠️ Heads Up")
+    st.warning(rec["warning"])
+
+    _, extension, mime = DOWNLOAD_FORMATS[download_format]
+    st.download_button(
+        f"💾 Download Recommendation as {download_format}",
+        data=download_future.result(),
+        file_name=f"travel_recommendation_{index}.{extension}",
+        mime=mime,
+        key=f"download_{index}"
+    )
 
 # --- Main App Function ---
 def main():
@@ -186,52 +509,46 @@ def main():
     prefs = destination_preferences_section()
     user_inputs = {**profile, **prefs}
 
+    st.session_state.setdefault("recs", None)
+    st.session_state.setdefault("recs_key", None)
+    st.session_state.setdefault("llm_usage", None)
+
+    # Drop a stored result as soon as the inputs it was generated for change
+    inputs_key = cache_key(canonical_inputs(user_inputs))
+    if st.session_state.recs_key != inputs_key:
+        st.session_state.recs = None
+
     if st.button("✨ Find My Perfect Destination", type="primary", use_container_width=True):
         with st.spinner("Analyzing 1,000+ destinations..."):
-            rec = get_perfect_destination(user_inputs)
-
-        if rec:
-            with st.container(border=True):
-                st.success(f"## 🏆 Your Perfect Match: {rec['destination']}")
-                st.markdown(f"**{rec['match_score']} match** | {user_inputs['duration']} day trip")
-
-                m = folium.Map(location=rec["coordinates"], zoom_start=12)
-                folium.Marker(
-                    rec["coordinates"],
-                    tooltip=f"Explore {rec['destination']}",
-                    icon=folium.Icon(color="red", icon="heart")
-                ).add_to(m)
-                folium_static(m, height=300)
-
-                st.markdown("### ❤️ Why This Fits You")
-                for point in rec["why_perfect"]:
-                    st.markdown(f"- {point.strip()}")
-
-                st.markdown("### 📅 Sample Itinerary")
-                for day in rec["itinerary_highlights"]:
-                    st.markdown(f"- {day}")
-
-                with st.expander("🔍 Local Insider Secret"):
-                    st.markdown(f"*{rec['local_secret']}*")
-
-                st.markdown("### ⚠️ Heads Up")
-                st.warning(rec["warning"])
-
-                json_path = save_recommendation_to_file(rec)
-                with open(json_path, "rb") as jf:
-                    st.download_button(
-                        "💾 Save Recommendation as File", 
-                        jf, 
-                        file_name="travel_recommendation.json"
-                    )
-
-    st.markdown("""
-    <div class="small-font" style="margin-top: 50px;">
-        <hr>
-        <p>🔎 <strong>Note:</strong> These destination suggestions are generated by an AI model based on patterns and probabilities from your inputs.</p>
-        <p>⚠️ <strong>Disclaimer:</strong> This app is built purely for educational and experimental purposes as part of a study project. It does not provide professional travel advice or guarantee the accuracy of its recommendations. All travel suggestions are generated by an AI model and should be independently verified before making decisions. No personal data is collected, stored, or used for any commercial intent.</p>
-    </div>
-    """, unsafe_allow_html=True)
+            st.session_state.recs = get_perfect_destination(user_inputs)
+            st.session_state.recs_key = inputs_key
+
+    recs = st.session_state.recs
+    if recs:
+        download_format = st.radio("Download as", tuple(DOWNLOAD_FORMATS), horizontal=True)
+        exporter = DOWNLOAD_FORMATS[download_format][0]
+        executor = get_executor()
+        futures = [executor.submit(exporter, rec) for rec in recs]
+
+        for index, (rec, download_future) in enumerate(zip(recs, futures), start=1):
+            with st.expander(f"{index}. {rec['destination']} ({rec['match_score']})", expanded=index == 1):
+                render_recommendation(rec, user_inputs, index, download_format, download_future)
+
+        if st.button("🔄 Clear result"):
+            st.session_state.recs = None
+            st.rerun()
+
+        usage = st.session_state.llm_usage
+        if usage and usage["prompt_tokens"]:
+            hit_rate = usage["cached_tokens"] / usage["prompt_tokens"] * 100
+            st.caption(
+                f"Prompt tokens: {usage['prompt_tokens']} · "
+                f"cached: {usage['cached_tokens']} ({hit_rate:.0f}%)"
+            )
+
+    st.markdown(load_asset("disclaimer.html"), unsafe_allow_html=True)
+
+    st.sidebar.metric("Similar-profile cache hits", get_similar_profiles()["hits"])
 
 if __name__ == "__main__":
     main()